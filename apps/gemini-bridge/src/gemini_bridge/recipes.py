@@ -22,6 +22,11 @@ from typing import Any
 
 import yaml
 
+try:  # libyaml parses recipe frontmatter an order of magnitude faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pure-Python fallback when PyYAML was built without it
+    from yaml import SafeLoader as _YamlLoader
+
 # Verified against google/genai/_gaos/types/interactions/generationconfig.py
 GENERATION_CONFIG_KEYS = frozenset(
     {
@@ -124,7 +129,7 @@ def parse(text: str, name: str, path: Path | None = None) -> Recipe:
     if not match:
         raise RecipeError(f"{name}: missing YAML frontmatter delimited by ---")
     raw, body = match.groups()
-    data = yaml.safe_load(raw) or {}
+    data = yaml.load(raw, Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise RecipeError(f"{name}: frontmatter must be a mapping")
 
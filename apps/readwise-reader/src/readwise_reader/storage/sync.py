@@ -17,6 +17,11 @@ class SyncEngine:
     def __init__(self, client: ReadwiseClient, db: Database) -> None:
         self.client = client
         self.db = db
+        # v2_book_id -> resolved v3 doc_id. Export pages repeat the same
+        # books, so each resolution after the first is a dict hit instead
+        # of one or two DB lookups. Fallback "v2:" IDs are never cached:
+        # the document may sync mid-run and change the answer.
+        self._doc_id_cache: dict[int, str] = {}
 
     async def sync_documents(self, full: bool = False) -> dict[str, int]:
         """Sync documents from Readwise API to DuckDB.
@@ -38,23 +43,27 @@ class SyncEngine:
         created = 0
         updated = 0
 
-        for doc in docs:
-            doc_dict = doc.model_dump()
-            existing = self.db.get_document(doc_dict["id"])
-            self.db.upsert_document(doc_dict)
-
-            if existing:
-                updated += 1
-                self.db.log_change(doc_dict["id"], "update", "sync")
-            else:
-                created += 1
-                self.db.log_change(doc_dict["id"], "create", "sync")
-
-            # Sync tags from document
-            if doc_dict.get("tags"):
-                for tag_name in doc_dict["tags"]:
-                    tag_key = tag_name.lower().replace(" ", "-")
-                    self.db.upsert_tag(tag_key, tag_name)
+        # One timestamp for the whole batch: every row of a sync shares its
+        # last_synced_at, and the per-row datetime construction goes away
+        synced_at = datetime.now(UTC).isoformat()
+        with self.db.transaction():
+            for doc in docs:
+                doc_dict = doc.model_dump()
+                existing = self.db.get_document(doc_dict["id"])
+                self.db.upsert_document(doc_dict, synced_at=synced_at)
+
+                if existing:
+                    updated += 1
+                    self.db.log_change(doc_dict["id"], "update", "sync")
+                else:
+                    created += 1
+                    self.db.log_change(doc_dict["id"], "create", "sync")
+
+                # Sync tags from document
+                if doc_dict.get("tags"):
+                    for tag_name in doc_dict["tags"]:
+                        tag_key = tag_name.lower().replace(" ", "-")
+                        self.db.upsert_tag(tag_key, tag_name, last_used_at=synced_at)
 
         # Update sync timestamp and rebuild search indexes
         now = datetime.now(UTC).isoformat()
@@ -70,15 +79,23 @@ class SyncEngine:
         1. Direct v2_book_id mapping on dim_documents
         2. URL match (source_url or url), then store the v2_book_id mapping
         3. Fallback: "v2:{id}" prefix (reconciled later in full_sync)
+
+        Resolved IDs are cached per engine instance; the fallback is not.
         """
+        cached = self._doc_id_cache.get(v2_book_id)
+        if cached:
+            return cached
+
         doc_id = self.db.get_doc_id_by_v2_book_id(v2_book_id)
         if doc_id:
+            self._doc_id_cache[v2_book_id] = doc_id
             return doc_id
 
         if source_url:
             doc_id = self.db.get_doc_id_by_url(source_url)
             if doc_id:
                 self.db.set_v2_book_id(doc_id, v2_book_id)
+                self._doc_id_cache[v2_book_id] = doc_id
                 return doc_id
 
         return f"v2:{v2_book_id}"
@@ -102,12 +119,15 @@ class SyncEngine:
             result = await self.client.export_highlights(
                 updated_after=updated_after, page_cursor=cursor
             )
-            for book in result.results:
-                doc_id = self._resolve_doc_id(book.user_book_id, book.source_url)
-                for highlight in book.highlights:
-                    h_dict = highlight.model_dump()
-                    self.db.upsert_highlight(h_dict, doc_id)
-                    total_highlights += 1
+            # One transaction per export page: a commit per highlight is the
+            # slow path, a transaction across pages holds locks through HTTP.
+            with self.db.transaction():
+                for book in result.results:
+                    doc_id = self._resolve_doc_id(book.user_book_id, book.source_url)
+                    self.db.upsert_highlights(
+                        [h.model_dump() for h in book.highlights], doc_id
+                    )
+                    total_highlights += len(book.highlights)
 
             cursor = result.nextPageCursor
             if not cursor:
@@ -122,8 +142,10 @@ class SyncEngine:
     async def sync_tags(self) -> dict[str, int]:
         """Sync all tags from Readwise API."""
         tags = await self.client.list_all_tags()
-        for tag in tags:
-            self.db.upsert_tag(tag["key"], tag["name"])
+        synced_at = datetime.now(UTC).isoformat()
+        with self.db.transaction():
+            for tag in tags:
+                self.db.upsert_tag(tag["key"], tag["name"], last_used_at=synced_at)
         self.db.refresh_tag_counts()
         logger.info("Tag sync complete: %d tags", len(tags))
         return {"tags_synced": len(tags)}
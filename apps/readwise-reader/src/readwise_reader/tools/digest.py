@@ -52,29 +52,21 @@ def register_digest_tools(mcp: FastMCP) -> None:
         if not since:
             since = (datetime.now(UTC) - timedelta(days=7)).isoformat()
 
-        recent_docs = db.query_documents(since=since, limit=200)
-
-        # Break down by location
-        by_location: dict[str, int] = {}
-        by_category: dict[str, int] = {}
-        for doc in recent_docs:
-            loc = doc.get("location", "unknown") or "unknown"
-            by_location[loc] = by_location.get(loc, 0) + 1
-            cat = doc.get("category", "unknown") or "unknown"
-            by_category[cat] = by_category.get(cat, 0) + 1
+        # Counts are aggregated in SQL over every matching document; the
+        # row fetch is only for the ten recent titles
+        activity = db.reading_activity(since)
+        recent_docs = db.query_documents(since=since, limit=10)
 
         return {
             "since": since,
-            "total_documents": len(recent_docs),
-            "by_location": by_location,
-            "by_category": by_category,
+            **activity,
             "recent_titles": [
                 {
                     "title": d.get("title"),
                     "category": d.get("category"),
                     "location": d.get("location"),
                 }
-                for d in recent_docs[:10]
+                for d in recent_docs
             ],
         }
 
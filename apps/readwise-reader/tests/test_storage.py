@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import duckdb
 import pytest
 
 from readwise_reader.storage.database import Database
@@ -47,6 +48,12 @@ class TestDocumentCRUD:
         assert result is not None
         assert result["title"] == "Updated Title"
 
+    def test_upsert_with_explicit_synced_at(self, db: Database, sample_doc: dict) -> None:
+        db.upsert_document(sample_doc, synced_at="2026-01-01T00:00:00+00:00")
+        result = db.get_document("doc_001")
+        assert result is not None
+        assert str(result["last_synced_at"]).startswith("2026-01-01")
+
     def test_get_nonexistent(self, db: Database) -> None:
         result = db.get_document("nonexistent")
         assert result is None
@@ -114,6 +121,25 @@ class TestHighlights:
         assert results[0]["content_text"] == "Important text"
         assert results[0]["note"] == "My note"
 
+    def test_batch_upsert(self, db: Database) -> None:
+        db.upsert_document({"id": "doc1", "title": "Test Doc"})
+        db.upsert_highlights(
+            [
+                {"id": "h1", "text": "first highlight"},
+                {"id": "h2", "text": "second highlight"},
+            ],
+            doc_id="doc1",
+        )
+        results = db.get_highlights(doc_id="doc1")
+        assert len(results) == 2
+
+    def test_batch_upsert_routes_to_staging(self, db: Database) -> None:
+        db.upsert_highlights([{"id": "h1", "text": "orphaned"}], doc_id="v2:42")
+        staging_count = db.conn.execute(
+            "SELECT COUNT(*) FROM staging_highlights"
+        ).fetchone()[0]
+        assert staging_count == 1
+
     def test_search_highlights(self, db: Database) -> None:
         db.upsert_document({"id": "doc1", "title": "Test Doc"})
         db.upsert_highlight({"id": "h1", "text": "Machine learning is powerful"}, doc_id="doc1")
@@ -167,6 +193,25 @@ class TestLibraryStats:
         assert stats["by_location"]["new"] == 2
         assert stats["inbox_size"] == 2
 
+    def test_reading_activity(self, db: Database) -> None:
+        db.upsert_document({
+            "id": "d1", "category": "article", "location": "new",
+            "updated_at": "2026-08-20T00:00:00+00:00",
+        })
+        db.upsert_document({
+            "id": "d2", "category": None, "location": "archive",
+            "updated_at": "2026-08-25T00:00:00+00:00",
+        })
+        db.upsert_document({
+            "id": "d3", "category": "article", "location": "new",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+        })
+
+        activity = db.reading_activity(since="2026-08-01T00:00:00+00:00")
+        assert activity["total_documents"] == 2
+        assert activity["by_category"] == {"article": 1, "unknown": 1}
+        assert activity["by_location"] == {"new": 1, "archive": 1}
+
 
 class TestFTSSearch:
     def test_bm25_returns_results(self, db: Database) -> None:
@@ -308,6 +353,122 @@ class TestIDReconciliation:
         assert staging_count == 0
 
 
+class TestDocIdResolutionCache:
+    def test_resolved_id_cached(self, db: Database, monkeypatch) -> None:
+        from readwise_reader.storage.sync import SyncEngine
+
+        db.upsert_document({"id": "abc-123", "title": "Test", "v2_book_id": 42})
+        engine = SyncEngine(client=None, db=db)  # type: ignore[arg-type]
+
+        calls = {"n": 0}
+        original = db.get_doc_id_by_v2_book_id
+
+        def counting(v2_book_id: int) -> str | None:
+            calls["n"] += 1
+            return original(v2_book_id)
+
+        monkeypatch.setattr(db, "get_doc_id_by_v2_book_id", counting)
+
+        assert engine._resolve_doc_id(42, None) == "abc-123"
+        assert engine._resolve_doc_id(42, None) == "abc-123"
+        assert calls["n"] == 1
+
+    def test_fallback_never_cached(self, db: Database) -> None:
+        from readwise_reader.storage.sync import SyncEngine
+
+        engine = SyncEngine(client=None, db=db)  # type: ignore[arg-type]
+
+        # Unknown book: fallback prefix, and no cache entry
+        assert engine._resolve_doc_id(99, None) == "v2:99"
+
+        # Once the document syncs, the same book must resolve for real
+        db.upsert_document({"id": "late-doc", "title": "Late", "v2_book_id": 99})
+        assert engine._resolve_doc_id(99, None) == "late-doc"
+
+
+class TestSchemaInit:
+    def test_reconnect_skips_fts_rebuild(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Rebuild scans both indexed tables; reconnecting to an existing DB
+        # must not pay that on every construction
+        Database(db_path=tmp_path / "test.duckdb").close()
+
+        calls: list[int] = []
+        monkeypatch.setattr(
+            Database, "rebuild_fts_indexes", lambda self: calls.append(1)
+        )
+        db2 = Database(db_path=tmp_path / "test.duckdb")
+        assert calls == []
+        db2.close()
+
+    def test_search_works_after_reconnect(self, tmp_path: Path) -> None:
+        db1 = Database(db_path=tmp_path / "test.duckdb")
+        db1.upsert_document({
+            "id": "d1",
+            "title": "Machine Learning Fundamentals",
+            "summary": "An introduction to ML concepts",
+        })
+        db1.rebuild_fts_indexes()
+        db1.close()
+
+        db2 = Database(db_path=tmp_path / "test.duckdb")
+        results = db2.search_documents("machine learning")
+        assert len(results) == 1
+        assert results[0]["doc_id"] == "d1"
+        db2.close()
+
+
+class TestConnectionTuning:
+    def test_env_overrides_apply(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setenv("READWISE_DB_THREADS", "2")
+        monkeypatch.setenv("READWISE_DB_MEMORY_LIMIT", "512MiB")
+        db = Database(db_path=tmp_path / "tuned.duckdb")
+        assert db.conn.execute("SELECT current_setting('threads')").fetchone()[0] == 2
+        assert (
+            db.conn.execute("SELECT current_setting('memory_limit')").fetchone()[0]
+            == "512.0 MiB"
+        )
+
+    def test_unset_env_leaves_defaults(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.delenv("READWISE_DB_THREADS", raising=False)
+        default = duckdb.connect().execute(
+            "SELECT current_setting('threads')"
+        ).fetchone()[0]
+        db = Database(db_path=tmp_path / "plain.duckdb")
+        assert (
+            db.conn.execute("SELECT current_setting('threads')").fetchone()[0] == default
+        )
+
+    def test_malformed_values_name_the_env_var(self, tmp_path: Path, monkeypatch) -> None:
+        # A bad value fails construction with the variable name in the
+        # message, not a raw traceback from int() or the DuckDB parser
+        monkeypatch.setenv("READWISE_DB_THREADS", "abc")
+        with pytest.raises(ValueError, match="READWISE_DB_THREADS"):
+            Database(db_path=tmp_path / "bad_threads.duckdb")
+        monkeypatch.delenv("READWISE_DB_THREADS")
+        monkeypatch.setenv("READWISE_DB_MEMORY_LIMIT", "lots")
+        with pytest.raises(ValueError, match="READWISE_DB_MEMORY_LIMIT"):
+            Database(db_path=tmp_path / "bad_mem.duckdb")
+
+
+class TestTransaction:
+    def test_commit_persists(self, db: Database) -> None:
+        with db.transaction():
+            db.upsert_document({"id": "d1", "title": "One"})
+            db.upsert_document({"id": "d2", "title": "Two"})
+        assert db.get_document("d1") is not None
+        assert db.get_document("d2") is not None
+
+    def test_rollback_on_error(self, db: Database) -> None:
+        # An exception mid-batch rolls back everything, including rows
+        # written before the failure
+        with pytest.raises(RuntimeError), db.transaction():
+            db.upsert_document({"id": "d1", "title": "One"})
+            raise RuntimeError("boom")
+        assert db.get_document("d1") is None
+
+
 class TestAudit:
     def test_log_change(self, db: Database) -> None:
         db.log_change("doc1", "create", "test")
@@ -151,14 +151,20 @@ def validate_frontmatter(
     return errors
 
 
-def validate_cc(skill_dir: Path) -> list[str]:
-    """Validate a skill against the Claude Code schema. [] means valid."""
+def validate_cc(skill_dir: Path, content: str | None = None) -> list[str]:
+    """Validate a skill against the Claude Code schema. [] means valid.
+
+    Pass `content` when the caller has already read SKILL.md (the --all
+    path reads each file once and shares it across checks).
+    """
     skill_dir = Path(skill_dir)
     skill_md = find_skill_md(skill_dir)
     if skill_md is None:
         return ["SKILL.md not found"]
     try:
-        metadata, _ = parse_frontmatter(skill_md.read_text(encoding="utf-8"))
+        if content is None:
+            content = skill_md.read_text(encoding="utf-8")
+        metadata, _ = parse_frontmatter(content)
     except Exception as e:
         # Surface the parser's own reason ("must start with ---", "Invalid YAML
         # ...") rather than collapsing every failure into one generic message.
@@ -1,5 +1,6 @@
 """Per-repo configuration and state directory management."""
 
+import os
 from datetime import date
 from pathlib import Path
 
@@ -98,12 +99,29 @@ def best_practices_file(root: Path) -> Path:
     return config_dir(root) / "best_practices.md"
 
 
+# path -> (mtime_ns, parsed config). One CLI run reads the config through
+# every get_* helper; the parse repeats only when the file changed.
+_config_cache: dict[Path, tuple[int, dict]] = {}
+
+
 def load_config(root: Path) -> dict:
-    """Load .skill-maintainer/config.json, returning defaults if missing."""
+    """Load .skill-maintainer/config.json, returning defaults if missing.
+
+    Cached on `st_mtime_ns`, so an edit mid-process is picked up while
+    repeat reads of an unchanged file skip the parse. Callers treat the
+    returned dict as read-only.
+    """
     cfg_path = config_dir(root) / CONFIG_FILE
-    if cfg_path.exists():
-        return orjson.loads(cfg_path.read_bytes())
-    return {}
+    try:
+        mtime = cfg_path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    cached = _config_cache.get(cfg_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    cfg = orjson.loads(cfg_path.read_bytes())
+    _config_cache[cfg_path] = (mtime, cfg)
+    return cfg
 
 
 def get_upstream_urls(root: Path) -> list[str]:
@@ -130,10 +148,18 @@ def load_hashes(root: Path) -> dict:
 
 
 def save_hashes(root: Path, hashes: dict) -> None:
-    """Save upstream_hashes.json state."""
+    """Save upstream_hashes.json state.
+
+    Compact JSON, not indented: the file is machine state read back by
+    `load_hashes`, never hand-edited (config.json, which humans do edit,
+    keeps its indent in `init_config`). Written via temp file + rename so
+    a crash mid-write leaves the old state intact rather than truncated.
+    """
     hf = hashes_file(root)
     hf.parent.mkdir(parents=True, exist_ok=True)
-    hf.write_bytes(orjson.dumps(hashes, option=orjson.OPT_INDENT_2))
+    tmp = hf.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(hashes))
+    os.replace(tmp, hf)
 
 
 def append_event(root: Path, event: dict) -> None:
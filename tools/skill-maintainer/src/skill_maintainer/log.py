@@ -1,6 +1,8 @@
 """Query the append-only changes log."""
 
 import sys
+from collections import deque
+from collections.abc import Iterator
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -9,15 +11,24 @@ import orjson
 from skill_maintainer.config import changes_log
 
 
-def load_events(root: Path) -> list[dict]:
+def iter_events(root: Path) -> Iterator[dict]:
+    """Stream events from changes.jsonl one line at a time.
+
+    The log is append-only and grows without bound; streaming keeps
+    filtered queries at one parsed event in memory instead of the whole
+    file.
+    """
     log_path = changes_log(root)
     if not log_path.exists():
-        return []
-    events = []
-    for line in log_path.read_bytes().splitlines():
-        if line.strip():
-            events.append(orjson.loads(line))
-    return events
+        return
+    with open(log_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def load_events(root: Path) -> list[dict]:
+    return list(iter_events(root))
 
 
 def main(args=None):
@@ -30,23 +41,27 @@ def main(args=None):
     parser.add_argument("--tail", type=int, default=None, help="Show last N events")
     parsed = parser.parse_args(args)
 
-    events = load_events(parsed.dir)
-    if not events:
+    log_path = changes_log(parsed.dir)
+    if not log_path.exists() or log_path.stat().st_size == 0:
         print("No events in log.", file=sys.stderr)
         sys.exit(0)
+    stream = iter_events(parsed.dir)
 
-    # Filter by date
+    # Filters apply as the stream is read -- non-matching events are
+    # parsed and dropped, never accumulated
     if parsed.days is not None:
         cutoff = (date.today() - timedelta(days=parsed.days)).isoformat()
-        events = [e for e in events if e.get("date", "") >= cutoff]
+        stream = (e for e in stream if e.get("date", "") >= cutoff)
 
-    # Filter by type
     if parsed.type:
-        events = [e for e in events if e.get("type") == parsed.type]
+        stream = (e for e in stream if e.get("type") == parsed.type)
 
-    # Tail
+    # Tail: a bounded deque keeps only the last N matches
+    events: list[dict] | deque[dict]
     if parsed.tail:
-        events = events[-parsed.tail:]
+        events = deque(stream, maxlen=parsed.tail)
+    else:
+        events = list(stream)
 
     if not events:
         print("No matching events.", file=sys.stderr)
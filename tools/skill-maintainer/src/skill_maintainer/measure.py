@@ -12,6 +12,19 @@ FILE_TYPE_MAP = {
 
 SKIP_DIRS_WITH_STATE = SKIP_DIRS | {"state"}
 
+# The report's fixed prefix, built once at import. Every interpolated value is
+# a module constant, and one block keeps the template auditable in one place
+# instead of spread across eight appends.
+_REPORT_HEADER = f"""\
+# Token Budget Report
+
+Budget threshold: {TOKEN_BUDGET_WARN} tokens (warn), {TOKEN_BUDGET_CRITICAL} tokens (critical)
+Budget applies to SKILL.md only; reference tokens are informational.
+Estimate: 1 token ~ 4 characters
+
+| Skill | Files | Skill | Refs | Total | Status |
+|-------|-------|-------|------|-------|--------|"""
+
 
 def classify_file(file_path: Path, skill_root: Path) -> str:
     name = file_path.name
@@ -69,7 +82,7 @@ def walk_skill_files(skill_path: Path) -> list[tuple[Path, str]]:
             continue
         if item.name.startswith("."):
             continue
-        if any(skip in item.parts for skip in SKIP_DIRS_WITH_STATE):
+        if not SKIP_DIRS_WITH_STATE.isdisjoint(item.parts):
             continue
         if item.suffix in (".md", ".py", ".yaml", ".yml", ".json", ".txt", ".sh", ".toml"):
             file_type = classify_file(item, skill_path)
@@ -114,16 +127,7 @@ def measure_skill(skill_name: str, skill_path: Path) -> dict:
 
 
 def generate_report(results: list[dict]) -> str:
-    lines = [
-        "# Token Budget Report",
-        "",
-        f"Budget threshold: {TOKEN_BUDGET_WARN} tokens (warn), {TOKEN_BUDGET_CRITICAL} tokens (critical)",
-        "Budget applies to SKILL.md only; reference tokens are informational.",
-        "Estimate: 1 token ~ 4 characters",
-        "",
-        "| Skill | Files | Skill | Refs | Total | Status |",
-        "|-------|-------|-------|------|-------|--------|",
-    ]
+    lines = [_REPORT_HEADER]
 
     for r in results:
         if r["critical"]:
@@ -189,7 +193,10 @@ def main(args=None):
 
     report = generate_report(results)
     if parsed.output:
-        parsed.output.write_text(report)
+        # Explicit UTF-8 bytes: write_text without an encoding falls back to
+        # the platform default, and the report may contain non-ASCII
+        # (skill names, prose pulled from files)
+        parsed.output.write_bytes(report.encode("utf-8"))
         print(f"Report written to {parsed.output}", file=sys.stderr)
     else:
         print(report)
@@ -40,8 +40,14 @@ def analyze_skill(skill_dir: Path) -> dict:
         result["errors"] = ["SKILL.md not found"]
         return result
 
+    # One read serves validation and the frontmatter fields below
+    try:
+        content = skill_md.read_text(encoding="utf-8")
+    except OSError:
+        content = None
+
     # Validation
-    errors = validate(skill_dir)
+    errors = validate(skill_dir, content=content)
     result["valid"] = len(errors) == 0
     result["errors"] = errors
 
@@ -57,7 +63,6 @@ def analyze_skill(skill_dir: Path) -> dict:
 
     # Parse frontmatter
     try:
-        content = skill_md.read_text()
         metadata, _ = parse_frontmatter(content)
     except Exception:
         return result
@@ -1,8 +1,12 @@
 """Shared constants and utilities for skill-maintainer."""
 
+import os
+import re
 from pathlib import Path
 
-SKIP_DIRS = {"__pycache__", ".backup", "node_modules", ".git", "coderef", ".venv", "internal"}
+SKIP_DIRS: frozenset[str] = frozenset(
+    {"__pycache__", ".backup", "node_modules", ".git", "coderef", ".venv", "internal"}
+)
 """Directories never scanned for skills or plugins.
 
 `_deprecated` used to be here, for units withdrawn from circulation but kept on
@@ -57,23 +61,45 @@ def _skipped(path: Path, root: Path) -> bool:
     # refactor, which is exactly what happened.
     if any(rel.parts[: len(p)] == p for p in SKIP_PATH_PREFIXES):
         return True
-    return any(part in SKIP_DIRS or part.endswith(".backup") for part in rel.parts)
+    if not SKIP_DIRS.isdisjoint(rel.parts):
+        return True
+    return any(part.endswith(".backup") for part in rel.parts)
 
 
 def discover_skills(root: Path) -> list[Path]:
-    """Find all SKILL.md files, return their parent directories."""
+    """Find all SKILL.md files, return their parent directories.
+
+    Walks with `os.walk` and prunes skipped directories *before*
+    descending: `.venv`, `node_modules` and worktrees are never
+    enumerated, where rglob-then-`_skipped` paid to list every entry in
+    the pruned universe first. Verdicts are identical to `_skipped`'s --
+    the skip rules live in the prune so they cannot drift apart.
+    """
     results = []
-    for skill_md in sorted(root.rglob("SKILL.md")):
-        if _skipped(skill_md, root):
-            continue
-        results.append(skill_md.parent)
-    return results
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_parts = Path(dirpath).relative_to(root).parts
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if d not in SKIP_DIRS
+            and not d.endswith(".backup")
+            and not any(
+                (*rel_parts, d)[: len(p)] == p for p in SKIP_PATH_PREFIXES
+            )
+        ]
+        if "SKILL.md" in filenames:
+            results.append(Path(dirpath))
+    return sorted(results)
 
 
 def discover_plugins(root: Path) -> list[Path]:
     """Find all plugin directories (have .claude-plugin/plugin.json), skip coderef/."""
     results = []
-    for pj in sorted(root.rglob(".claude-plugin/plugin.json")):
+    # Filter first, sort the survivors: sorting before _skipped paid
+    # O(M log M) over .venv/worktree entries that were then discarded. The
+    # fixed .claude-plugin/plugin.json suffix means ordering by plugin dir
+    # matches the old ordering by manifest path.
+    for pj in root.rglob(".claude-plugin/plugin.json"):
         if _skipped(pj, root):
             continue
         # plugin dir is parent of .claude-plugin/
@@ -82,6 +108,7 @@ def discover_plugins(root: Path) -> list[Path]:
         if plugin_dir == root:
             continue
         results.append(plugin_dir)
+    results.sort()
     return results
 
 
@@ -103,7 +130,7 @@ def measure_tokens(skill_dir: Path) -> dict[str, int]:
     for f in skill_dir.rglob("*"):
         if f.is_dir() or f.name.startswith("."):
             continue
-        if any(s in f.parts for s in skip):
+        if not skip.isdisjoint(f.parts):
             continue
         if f.suffix == ".md":
             try:
@@ -214,6 +241,12 @@ _WHEN_PHRASES = (
     "trigger", "mention", "says",
 )
 
+# One compiled alternation per list: a single scan of the description
+# instead of one substring pass per phrase. The tuples stay the source of
+# truth; add phrases there.
+_WHAT_RE = re.compile("|".join(map(re.escape, _WHAT_PHRASES)))
+_WHEN_RE = re.compile("|".join(map(re.escape, _WHEN_PHRASES)))
+
 
 def check_description_quality(
     description: str, *, model_invocable: bool = True
@@ -239,13 +272,11 @@ def check_description_quality(
     desc_lower = description.lower()
     first_word = desc_lower.split()[0].strip(",.:;!?") if desc_lower.split() else ""
 
-    has_what = first_word in _WHAT_VERBS or any(
-        p in desc_lower for p in _WHAT_PHRASES
-    )
+    has_what = first_word in _WHAT_VERBS or _WHAT_RE.search(desc_lower) is not None
     if not has_what:
         issues.append("missing WHAT verb")
 
-    if model_invocable and not any(p in desc_lower for p in _WHEN_PHRASES):
+    if model_invocable and _WHEN_RE.search(desc_lower) is None:
         issues.append("missing WHEN trigger")
 
     return issues
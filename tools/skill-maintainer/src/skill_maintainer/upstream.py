@@ -211,8 +211,12 @@ def main(args=None):
 
     # Save state
     if not parsed.no_save:
-        save_hashes(root, new_hashes)
-        print(f"\nHashes saved to {hashes_file(root)}", file=sys.stderr)
+        # The common run detects nothing; skip the no-op rewrite then
+        if new_hashes != old_hashes:
+            save_hashes(root, new_hashes)
+            print(f"\nHashes saved to {hashes_file(root)}", file=sys.stderr)
+        else:
+            print("\nHash state unchanged; not rewritten.", file=sys.stderr)
         # Write snapshots only for changed pages or pages missing a baseline.
         # Skipping unchanged pages avoids bumping mtime on bytes-identical files.
         changed_urls = {c["url"] for c in changed}
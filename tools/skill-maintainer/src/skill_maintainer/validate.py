@@ -5,7 +5,10 @@ skill frontmatter schema, a superset of the cross-vendor Agent Skills spec. Pass
 `--strict` to additionally run the cross-vendor portability check.
 """
 
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from skills_ref.parser import find_skill_md, parse_frontmatter
@@ -16,28 +19,41 @@ from skill_maintainer.shared import check_description_quality
 SKILL_MD_MAX_LINES = 500
 SKILL_MD_MAX_WORDS = 5000
 
+# Same tokenization as str.split(): maximal runs of non-whitespace
+_WORD_RE = re.compile(r"\S+")
 
-def check_best_practices(skill_path: Path) -> list[str]:
-    """Run additional best-practice checks beyond schema validation."""
+# Path-ish tokens for the reference-link check: filenames as they appear in
+# markdown links and inline code
+_PATHLIKE_RE = re.compile(r"[\w./-]+")
+
+
+def check_best_practices(skill_path: Path, content: str | None = None) -> list[str]:
+    """Run additional best-practice checks beyond schema validation.
+
+    `content` lets validate_single share one read of SKILL.md across checks.
+    """
     warnings = []
     skill_md = find_skill_md(skill_path)
 
     if skill_md is None:
         return ["SKILL.md not found"]
 
-    content = skill_md.read_text(encoding="utf-8")
-    lines = content.splitlines()
-    words = content.split()
+    if content is None:
+        content = skill_md.read_text(encoding="utf-8")
+    # Counts only -- no need to materialize the line and word lists that
+    # splitlines()/split() would allocate side by side
+    line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+    word_count = sum(1 for _ in _WORD_RE.finditer(content))
 
-    if len(lines) > SKILL_MD_MAX_LINES:
+    if line_count > SKILL_MD_MAX_LINES:
         warnings.append(
-            f"SKILL.md has {len(lines)} lines (recommended max: {SKILL_MD_MAX_LINES}). "
+            f"SKILL.md has {line_count} lines (recommended max: {SKILL_MD_MAX_LINES}). "
             "Consider moving detailed docs to references/."
         )
 
-    if len(words) > SKILL_MD_MAX_WORDS:
+    if word_count > SKILL_MD_MAX_WORDS:
         warnings.append(
-            f"SKILL.md has {len(words)} words (recommended max: {SKILL_MD_MAX_WORDS}). "
+            f"SKILL.md has {word_count} words (recommended max: {SKILL_MD_MAX_WORDS}). "
             "Consider using progressive disclosure."
         )
 
@@ -65,10 +81,21 @@ def check_best_practices(skill_path: Path) -> list[str]:
         ref_files = list(refs_dir.iterdir())
         if ref_files:
             body_lower = body.lower() if body else ""
+            # Tokenize once and test membership, instead of one full-body
+            # substring scan per reference file. A token hit implies a
+            # substring hit, and the rare miss falls back to the scan, so
+            # the verdicts are unchanged.
+            body_tokens = set()
+            for tok in _PATHLIKE_RE.findall(body_lower):
+                body_tokens.add(tok)
+                if "/" in tok:
+                    # `references/foo.md` must satisfy a lookup for `foo.md`
+                    body_tokens.add(tok.rsplit("/", 1)[-1])
             for ref_file in ref_files:
                 if ref_file.name.startswith("."):
                     continue
-                if ref_file.name.lower() not in body_lower:
+                name_lower = ref_file.name.lower()
+                if name_lower not in body_tokens and name_lower not in body_lower:
                     warnings.append(
                         f"Reference file '{ref_file.name}' may not be linked "
                         "from SKILL.md. Link references so Claude knows about them."
@@ -85,17 +112,24 @@ def validate_single(
     With `strict`, Claude Code extension fields (valid by default) are reported
     as errors, so the skill must also pass the cross-vendor portability check.
     """
-    errors = validate_cc(skill_path)
-    warnings = check_best_practices(skill_path)
-
-    if strict:
-        skill_md = find_skill_md(skill_path)
-        if skill_md is not None:
-            try:
-                metadata, _ = parse_frontmatter(skill_md.read_text(encoding="utf-8"))
-                errors.extend(portability_warnings(metadata))
-            except Exception:
-                pass
+    # One read of SKILL.md, shared by schema, best-practice, and strict checks
+    skill_md = find_skill_md(skill_path)
+    content: str | None = None
+    if skill_md is not None:
+        try:
+            content = skill_md.read_text(encoding="utf-8")
+        except OSError:
+            pass
+
+    errors = validate_cc(skill_path, content=content)
+    warnings = check_best_practices(skill_path, content=content)
+
+    if strict and content is not None:
+        try:
+            metadata, _ = parse_frontmatter(content)
+            errors.extend(portability_warnings(metadata))
+        except Exception:
+            pass
 
     if verbose:
         if errors:
@@ -128,19 +162,42 @@ def main(args=None):
         "--strict", action="store_true",
         help="Also require cross-vendor Agent Skills portability (flag CC extensions)",
     )
+    parser.add_argument(
+        "--jobs", type=int, default=None,
+        help="Worker threads for --all (default: min(8, cpu count); 1 disables concurrency)",
+    )
     parser.add_argument("--verbose", "-v", action="store_true")
     parsed = parser.parse_args(args)
 
+    if parsed.jobs is not None and parsed.jobs < 1:
+        parser.error("--jobs must be >= 1")
+
     if parsed.all:
         skills = discover_skills(parsed.dir)
         all_valid = True
 
-        for skill_dir in skills:
+        # Skills validate independently, so run them concurrently and print
+        # afterwards in discovery order. Threads, not processes: the work is
+        # file reads plus small parses, and workers share the already-paid
+        # skills_ref import.
+        workers = parsed.jobs or min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(
+                ex.map(lambda d: validate_single(d, False, parsed.strict), skills)
+            )
+
+        for skill_dir, (is_valid, errors, warnings) in zip(skills, results):
             name = skill_dir.name
             print(f"Validating {name} ({skill_dir})...", file=sys.stderr)
-            is_valid, errors, warnings = validate_single(
-                skill_dir, parsed.verbose, parsed.strict
-            )
+            if parsed.verbose:
+                if errors:
+                    print(f"  ERRORS ({len(errors)}):", file=sys.stderr)
+                    for e in errors:
+                        print(f"    - {e}", file=sys.stderr)
+                if warnings:
+                    print(f"  WARNINGS ({len(warnings)}):", file=sys.stderr)
+                    for w in warnings:
+                        print(f"    - {w}", file=sys.stderr)
 
             if is_valid:
                 status = "PASS"
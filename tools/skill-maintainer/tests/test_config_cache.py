@@ -0,0 +1,45 @@
+"""`load_config`'s cache must be invisible: same answers, fewer parses.
+
+Claim: the config is read through every `get_*` helper in a single CLI run,
+so `load_config` caches the parsed dict keyed on `st_mtime_ns`. The property
+worth pinning is not that a cache exists but that it cannot serve stale
+data -- an edit to config.json must be reflected on the very next call.
+Deleting `test_edit_invalidates_cache` removes the only thing standing
+between "cache" and "first read wins forever".
+"""
+
+import orjson
+
+from skill_maintainer.config import config_dir, load_config
+
+
+def _write_config(root, cfg: dict) -> None:
+    cfg_dir = config_dir(root)
+    cfg_dir.mkdir(parents=True, exist_ok=True)
+    (cfg_dir / "config.json").write_bytes(orjson.dumps(cfg))
+
+
+def test_missing_config_reads_empty(tmp_path):
+    assert load_config(tmp_path) == {}
+
+
+def test_repeat_reads_hit_cache(tmp_path):
+    """An unchanged file is parsed once; the second call returns the cached dict."""
+    _write_config(tmp_path, {"tracked_repos": ["a"]})
+    first = load_config(tmp_path)
+    assert load_config(tmp_path) is first
+
+
+def test_edit_invalidates_cache(tmp_path):
+    """A rewritten config must be re-read -- mtime_ns, not existence, keys the cache."""
+    _write_config(tmp_path, {"tracked_repos": ["a"]})
+    assert load_config(tmp_path)["tracked_repos"] == ["a"]
+
+    # Force a distinct mtime even on coarse-grained filesystems
+    cfg_path = config_dir(tmp_path) / "config.json"
+    _write_config(tmp_path, {"tracked_repos": ["a", "b"]})
+    import os
+
+    os.utime(cfg_path, ns=(1, cfg_path.stat().st_mtime_ns + 1))
+
+    assert load_config(tmp_path)["tracked_repos"] == ["a", "b"]
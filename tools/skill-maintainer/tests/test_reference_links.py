@@ -0,0 +1,44 @@
+"""The reference-link warning must survive the tokenized fast path.
+
+Claim: `check_best_practices` warns when a file under `references/` never
+appears in the SKILL.md body. The check now tests set membership over
+path-ish tokens (with a substring fallback) instead of scanning the body
+per file; these cases pin that the rewrite kept the verdicts -- a linked
+file stays silent whether written bare or as `references/<name>`, and an
+unlinked file still warns. Deleting `test_unlinked_reference_warns` leaves
+nothing that would notice the check short-circuiting to "always linked".
+"""
+
+from skill_maintainer.validate import check_best_practices
+
+FRONTMATTER = (
+    "---\n"
+    "name: demo\n"
+    "description: Does a thing. Use when the user wants that thing done.\n"
+    "---\n\n"
+)
+
+
+def _skill(tmp_path, body, refs=("guide.md",)):
+    d = tmp_path / "demo"
+    (d / "references").mkdir(parents=True)
+    (d / "SKILL.md").write_text(FRONTMATTER + body, encoding="utf-8")
+    for name in refs:
+        (d / "references" / name).write_text("ref\n", encoding="utf-8")
+    return d
+
+
+def test_linked_by_path_is_silent(tmp_path):
+    """The common markdown form, `references/<name>`, must count as linked."""
+    d = _skill(tmp_path, "# demo\n\nSee [the guide](references/guide.md).\n")
+    assert not any("guide.md" in w for w in check_best_practices(d))
+
+
+def test_linked_by_bare_name_is_silent(tmp_path):
+    d = _skill(tmp_path, "# demo\n\nRead guide.md before starting.\n")
+    assert not any("guide.md" in w for w in check_best_practices(d))
+
+
+def test_unlinked_reference_warns(tmp_path):
+    d = _skill(tmp_path, "# demo\n\nNo links here.\n")
+    assert any("guide.md" in w for w in check_best_practices(d))